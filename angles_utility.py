@@ -15,9 +15,19 @@
 ### -----------------------------------------------------------------###
 
 import numpy as np
-import cmath
+import math
+from functools import lru_cache
+
+# Constants as plain Python floats, to keep NumPy out of scalar code paths
+_PI = math.pi
+_TWO_PI = 2.0*math.pi
+_INV_TWO_PI = 1.0/_TWO_PI
+_DEG2RAD = math.pi/180.0
+_RAD2DEG = 180.0/math.pi
 
 class Angle:
+    __slots__ = ('_degree','_radian','_complex')
+
     def __init__(self, deg=None, rad=None, complex=None) -> None:
         if complex: self.complex = complex
         elif rad:   self.radian = rad
@@ -33,89 +43,109 @@ class Angle:
 
     @degree.setter
     def degree(self, value):
-        self._degree = float(value%360)
-        self._radian = np.deg2rad(self._degree)
-        self._complex = cmath.rect(1,self._radian)
+        d = float(value%360)
+        if d == 360.0: d = 0.0                          # Tiny negative values round up to 360
+        self._degree = d
+        self._radian = None                             # Computed on demand
+        self._complex = None                            # Computed on demand
 
     @property
     def radian(self):
+        if self._radian is None: self._radian = self._degree*_DEG2RAD
         return self._radian
 
     @radian.setter
     def radian(self, value):
-        self._radian = float(value%(2*np.pi))
-        self._degree = np.rad2deg(self._radian)
-        self._complex = cmath.rect(1,self._radian)
+        r = float(value%_TWO_PI)
+        if r == _TWO_PI: r = 0.0                        # Tiny negative values round up to 2*pi
+        self._radian = r
+        self._degree = self._radian*_RAD2DEG
+        self._complex = None                            # Computed on demand
 
     @property
     def complex(self):
+        if self._complex is None:
+            r = self.radian
+            self._complex = complex(math.cos(r),math.sin(r))
         return self._complex
 
     @complex.setter
     def complex(self, value):
-        r,ang = cmath.polar(value)
-        if r==0: self._complex(1+0j)                    # Handle Singularity as 0
-        self._complex = value/r                         # Normalized value
-        self._radian = float(ang%(2*np.pi))
-        self._degree = np.rad2deg(self._radian)
+        v = complex(value)
+        r = math.hypot(v.real,v.imag)
+        if r == 0.0:                                    # Handle Singularity as 0
+            self._complex = 1+0j
+            self._radian = 0.0
+            self._degree = 0.0
+            return
+        self._complex = v/r                             # Normalized value
+        ang = math.atan2(v.imag,v.real) % _TWO_PI
+        if ang == _TWO_PI: ang = 0.0                    # Tiny negative angles round up to 2*pi
+        self._radian = ang
+        self._degree = self._radian*_RAD2DEG
 
     @property
     def sin(self):
-        return np.imag(self.complex)
+        return self.complex.imag
     @property
     def cos(self):
-        return np.real(self.complex)
+        return self.complex.real
     @property
     def tan(self):
-        return np.tan(self.radian)
+        return math.tan(self.radian)
     @property
     def sinh(self):
-        return np.sinh(self.sradian)
+        return math.sinh(self.sradian)
     @property
     def cosh(self):
-        return np.cosh(self.sradian)
+        return math.cosh(self.sradian)
     @property
     def tanh(self):
-        return np.tanh(self.sradian)
+        return math.tanh(self.sradian)
 
     @property
     def sdegree(self):
-        return self.degree if self.degree<180 else self.degree-360
+        degree = self._degree
+        return degree if degree<180 else degree-360
     @property
     def sradian(self):
-        return self.radian if self.radian<np.pi else self.radian-2*np.pi
+        radian = self.radian
+        return radian if radian<_PI else radian-_TWO_PI
     
     @property
     def frac(self):
-        return self.radian/(2*np.pi)
+        return self.radian*_INV_TWO_PI
 
     def __add__(self,value):
+        degree = self._degree
         if isinstance(value,Angle):
-            deg_res = value.degree + self.degree
+            deg_res = value._degree + degree
         else:
-            deg_res = value + self.degree
+            deg_res = value + degree
         return Angle(deg=deg_res)
     
     def __sub__(self,value):
+        degree = self._degree
         if isinstance(value,Angle):
-            deg_res = value.degree - self.degree
+            deg_res = value._degree - degree
         else:
-            deg_res = value - self.degree
+            deg_res = value - degree
         return Angle(deg=deg_res)    
     
     def __neg__(self):
-        return Angle(complex=np.conjugate(self.complex))
+        result = Angle(deg=-self._degree)
+        if self._complex is not None: result._complex = self._complex.conjugate()
+        return result
 
     def __eq__(self,value):
         '''Equivalency accounting for Float64 numerical error'''
         if isinstance(value,Angle):
-            comparison_value = value.degree
+            comparison_value = value._degree
         else:
             comparison_value = value
-        diff = abs(comparison_value - self.degree)
-        # If on the border between 0 and 360
-        if diff > 359: diff -= 360
-        return np.isclose(diff,0,rtol=1e-12)  
+        # Signed circular difference in [-180, 180)
+        diff = (comparison_value - self._degree + 180.0) % 360.0 - 180.0
+        return abs(diff) < 1e-8
     
     def __ne__(self,value):
         return not self.__eq__(value)
@@ -154,27 +184,92 @@ class Angle:
 
     def __abs__(self):
         ''' return value in the first semicircle (0-180 degrees) '''
-        if np.imag(self.complex) < 0: return self.__neg__()
-        else: return self
+        if self._degree <= 180: return self
+        # Lower semicircle: mirror the angle without going through the setters
+        result = Angle.__new__(Angle)
+        result._degree = 360.0 - self._degree
+        result._radian = None
+        result._complex = None if self._complex is None else self._complex.conjugate()
+        return result
+
+class AngleArray:
+    '''
+    Collection of angles stored as contiguous NumPy arrays
+        deg: array-like of float, angles in degree
+    '''
+    def __init__(self, deg) -> None:
+        self.deg = np.asarray(deg, dtype=np.float64) % 360
+        self.z = np.exp(1j*self.deg*_DEG2RAD)
+
+    @classmethod
+    def from_angles(cls, angle_list: list):
+        ''' Build an AngleArray from a list of Angle '''
+        return cls(np.fromiter((angle.degree for angle in angle_list), dtype=np.float64, count=len(angle_list)))
+
+    def __len__(self):
+        return self.deg.size
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)): return Angle(deg=self.deg[index])
+        return AngleArray(self.deg[index])
+
+    @property
+    def sin(self):
+        return self.z.imag
+    @property
+    def cos(self):
+        return self.z.real
+
+    def __add__(self,value):
+        if isinstance(value,AngleArray):
+            return AngleArray(self.deg + value.deg)
+        elif isinstance(value,Angle):
+            return AngleArray(self.deg + value.degree)
+        else:
+            return AngleArray(self.deg + value)
+
+    def mean(self) -> Angle:
+        ''' Return the mean of the angles '''
+        if self.deg.size == 0: raise ValueError('AngleArray must contain at least one angle')
+        return Angle(complex=complex(self.z.mean()))
+
+    def median(self) -> Angle:
+        ''' Return the geometric median of the angles, see geometric_median '''
+        if self.deg.size == 0: raise ValueError('AngleArray must contain at least one angle')
+        min_idx = _median_indices(self.z)
+        return Angle(complex=complex(self.z[min_idx].mean()))
 
 ### External Functions With angles
 
 def mean_angle(angle_list: list):
     '''
     Return the calculate mean of the angle contained in the list
-        angle_list: list[Angles]
+        angle_list: list[Angles] or AngleArray
 
         Output: Angle
     '''
-    number_of_elements  = 0
-    sum_of_angles = 0+0j
-    for elem in angle_list:
-        # Exclude All not Angle elements
-        if not isinstance(elem,Angle): continue
-        number_of_elements +=1
-        sum_of_angles += elem.complex
-    result = sum_of_angles/number_of_elements
-    return Angle(complex=result)
+    if isinstance(angle_list,AngleArray): return angle_list.mean()
+    # Exclude All not Angle elements
+    buffer = [elem.complex for elem in angle_list if isinstance(elem,Angle)]
+    if not buffer: raise ValueError('angle_list must contain at least one Angle')
+    return Angle(complex=sum(buffer)/len(buffer))
+
+def mean_angle_unchecked(angles: list) -> Angle:
+    '''
+    Same as mean_angle, without filtering: every element must be an Angle
+        angles: list[Angles]
+
+        Output: Angle
+    '''
+    if not angles: raise ValueError('angles must contain at least one Angle')
+    return Angle(complex=sum([angle.complex for angle in angles])/len(angles))
+
+@lru_cache(maxsize=32)
+def _angspace_template(steps):
+    ''' Return the read-only normalized subdivision [0, 1] in steps points '''
+    template = np.arange(steps, dtype=np.float64) / (steps-1)
+    template.flags.writeable = False
+    return template
 
 def angspace(start:Angle, end:Angle, steps=100):
     '''
@@ -189,12 +284,18 @@ def angspace(start:Angle, end:Angle, steps=100):
     '''
     if type(steps) != int or steps <2: raise ValueError('Parameter steps must be an integer >= 2')
     sweepsize = (end.degree-start.degree)%360
-    increment = sweepsize / (steps-1)
-    result = []
-    for i in range(steps):
-        result.append((start.degree+i*increment)%360)
-    return result
+    result = (start.degree + sweepsize*_angspace_template(steps)) % 360
+    return result.tolist()
+
 
+# Absolute tolerance, in radians, for ties between collective distances
+_MEDIAN_ATOL = 1e-10
+
+def _median_indices(z):
+    ''' Return the indices of the unit complex values with minimal collective distance '''
+    # Circular distance between each pair of angles, in radians
+    distances = np.abs(np.angle(z[:,None] * np.conj(z)[None,:])).sum(axis=1)
+    return np.flatnonzero(np.isclose(distances, distances.min(), rtol=0, atol=_MEDIAN_ATOL))
 
 def geometric_median(angle_list: list) -> Angle:
     ''' 
@@ -202,14 +303,101 @@ def geometric_median(angle_list: list) -> Angle:
     The returnin angle is the angle whose collective distance from all the others is the minimal
     If more than one angle correspond to the description the mean of all eligible angles is then returned
     '''
-    distances = []
-    for angle in angle_list:
-        distances.append(sum([(abs(angle-c)).degree for c in angle_list]))
-    min_value = min(distances)
-    min_idx = [index for index, value in enumerate(distances) if value == min_value]
+    if isinstance(angle_list,AngleArray): return angle_list.median()
+    z = np.fromiter((angle.complex for angle in angle_list), dtype=np.complex128, count=len(angle_list))
+    min_idx = _median_indices(z)
     angle_list = [ angle_list[ index ] for index in min_idx ]
     return mean_angle(angle_list)
 
+### Memoized geometric median, keyed on the rounded degrees of the input
+
+@lru_cache(maxsize=128)
+def _geometric_median_of_degrees(degrees: tuple) -> float:
+    return AngleArray(degrees).median().degree
+
+def geometric_median_cached(angles: tuple) -> Angle:
+    '''
+    Same as geometric_median, memoizing the result for repeated inputs
+    Angles are treated as immutable, equivalent inputs share the cached result
+        angles: tuple[Angle]
+
+        Output: Angle
+    '''
+    key = tuple(round(angle._degree, 12) for angle in angles)
+    return Angle(deg=_geometric_median_of_degrees(key))
+
+### Kernels on arrays of degrees (compiled with Numba on first use)
+
+def _mean_angle_deg(d):
+    s_re = 0.0
+    s_im = 0.0
+    k = _DEG2RAD
+    for i in range(d.size):
+        a = d[i]*k
+        s_re += math.cos(a)
+        s_im += math.sin(a)
+    return math.atan2(s_im, s_re)*_RAD2DEG
+
+def _geometric_median_deg(d):
+    n = d.size
+    distances = np.empty(n)
+    for i in range(n):
+        total = 0.0
+        for j in range(n):
+            diff = abs(d[i]-d[j]) % 360.0
+            if diff > 180.0: diff = 360.0-diff
+            total += diff
+        distances[i] = total
+    min_value = distances.min()
+    tolerance = _MEDIAN_ATOL*_RAD2DEG
+    # Mean of all the eligible angles
+    s_re = 0.0
+    s_im = 0.0
+    k = _DEG2RAD
+    for i in range(n):
+        if distances[i] - min_value <= tolerance:
+            a = d[i]*k
+            s_re += math.cos(a)
+            s_im += math.sin(a)
+    return math.atan2(s_im, s_re)*_RAD2DEG
+
+@lru_cache(maxsize=None)
+def _compiled_kernels():
+    ''' Return the compiled (mean, median) kernels, or None when Numba is not installed '''
+    try:
+        from numba import njit
+    except ImportError:                                 # Numba is optional
+        return None
+    jit = njit(cache=True, fastmath=True)
+    return jit(_mean_angle_deg), jit(_geometric_median_deg)
+
+def mean_angle_array(deg_arr) -> Angle:
+    '''
+    Return the mean of an array of angles expressed in degree
+        deg_arr: array-like of float
+
+        Output: Angle
+    '''
+    d = np.ascontiguousarray(deg_arr, dtype=np.float64).ravel()
+    if d.size == 0: raise ValueError('deg_arr must contain at least one angle')
+    kernels = _compiled_kernels()
+    if kernels is None: return AngleArray(d).mean()
+    return Angle(deg=kernels[0](d))
+
+def geometric_median_array(deg_arr) -> Angle:
+    '''
+    Return the geometric median of an array of angles expressed in degree
+    Same definition as geometric_median, ties are resolved with their mean
+        deg_arr: array-like of float
+
+        Output: Angle
+    '''
+    d = np.ascontiguousarray(deg_arr, dtype=np.float64).ravel()
+    if d.size == 0: raise ValueError('deg_arr must contain at least one angle')
+    kernels = _compiled_kernels()
+    if kernels is None: return AngleArray(d).median()
+    return Angle(deg=kernels[1](d))
+
     
 
 if __name__ == "__main__":